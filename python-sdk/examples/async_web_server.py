@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Async AI-powered web server example using Reflexive
+
+Same story generator as web_server.py, but served by aiohttp on a single
+asyncio event loop. Handlers await r.achat(), which runs the blocking chat
+call on the loop's default executor thread pool, so the event loop stays
+free to serve other requests while a story is generated. Each in-flight
+story still occupies an executor thread, so concurrent stories are capped
+at the pool size (min(32, CPU count + 4) by default).
+
+Requires: pip install aiohttp
+Run with: reflexive --debug async_web_server.py
+"""
+
+import reflexive
+from aiohttp import web
+
+# Create Reflexive instance (the story instructions are a cacheable prefix)
+r = reflexive.make_reflexive({
+    'cacheable_prefix': [
+        'You write stories for a web page. Reply with a very short (3-4 sentences) '
+        'story about the topic you are given, with no preamble.'
+    ],
+})
+
+# Track stats (handlers all run on one event loop, so no lock is needed)
+request_count = 0
+story_count = 0
+
+
+@web.middleware
+async def count_requests(request, handler):
+    global request_count
+
+    request_count += 1
+    r.set_state('requests.total', request_count)
+    r.log('info', f'{request.remote} - {request.method} {request.path_qs}')
+    return await handler(request)
+
+
+async def home(request):
+    html = f"""
+    <html>
+    <head><title>AI Story Generator</title></head>
+    <body style="font-family: sans-serif; max-width: 800px; margin: 50px auto;">
+        <h1>🤖 AI Story Generator</h1>
+        <p>Powered by Reflexive + Claude</p>
+        <p>Try: <a href="/story?topic=space+adventure">/story?topic=space+adventure</a></p>
+        <p>Or: <a href="/story?topic=mystery+detective">/story?topic=mystery+detective</a></p>
+        <hr>
+        <p><b>Stats:</b> {request_count} requests, {story_count} stories generated</p>
+    </body>
+    </html>
+    """
+    return web.Response(text=html, content_type='text/html')
+
+
+async def story(request):
+    global story_count
+
+    topic = request.query.get('topic', 'random')
+
+    story_count += 1
+    r.set_state('stories.generated', story_count)
+
+    # Use AI inline to generate the story, without blocking the event loop
+    r.log('info', f'Generating story about: {topic}')
+    text = await r.achat(f'Story topic: {topic}')
+
+    html = f"""
+    <html>
+    <head><title>Story: {topic}</title></head>
+    <body style="font-family: sans-serif; max-width: 800px; margin: 50px auto;">
+        <h1>📖 {topic.title()}</h1>
+        <div style="background: #f0f0f0; padding: 20px; border-radius: 8px; line-height: 1.6;">
+            {text}
+        </div>
+        <p><a href="/">← Back to home</a></p>
+    </body>
+    </html>
+    """
+    return web.Response(text=html, content_type='text/html')
+
+
+def create_app() -> web.Application:
+    app = web.Application(middlewares=[count_requests])
+    app.router.add_get('/', home)
+    app.router.add_get('/story', story)
+    return app
+
+
+if __name__ == '__main__':
+    port = 8080
+
+    print(f"🚀 Async AI Story Server running on http://localhost:{port}")
+    print(f"📊 Run with: reflexive --debug async_web_server.py")
+    print(f"   to get full AI introspection capabilities!")
+    print()
+
+    r.log('system', f'Server started on port {port}')
+
+    web.run_app(create_app(), port=port, print=None)
+
+    r.log('system', 'Server stopped')
@@ -16,7 +16,14 @@ import random
 r = reflexive.make_reflexive({
     'web_ui': True,
     'port': 3099,
-    'title': 'Data Pipeline Monitor'
+    'title': 'Data Pipeline Monitor',
+    # Static instructions are sent once as a cacheable prefix;
+    # each checkpoint only sends the changing part
+    'cacheable_prefix': [
+        "You are monitoring a data pipeline. For each checkpoint, analyze the "
+        "pipeline performance. Is the error rate acceptable? "
+        "Is processing time consistent? Give a brief assessment."
+    ],
 })
 
 print("🔄 Data Pipeline Monitor")
@@ -27,7 +34,7 @@ print()
 # Pipeline stats
 records_processed = 0
 errors = 0
-processing_times = []
+total_time = 0.0
 
 
 def process_record(record_id: int) -> tuple[bool, float]:
@@ -49,7 +56,7 @@ for i in range(100):
     record_id = i + 1
 
     success, proc_time = process_record(record_id)
-    processing_times.append(proc_time)
+    total_time += proc_time
 
     if success:
         records_processed += 1
@@ -63,8 +70,8 @@ for i in range(100):
     r.set_state('records.errors', errors)
     r.set_state('records.total', record_id)
 
-    # Calculate and track average processing time
-    avg_time = sum(processing_times) / len(processing_times)
+    # Track average processing time (running mean, no per-record history)
+    avg_time = total_time / record_id
     r.set_state('performance.avg_time', round(avg_time, 3))
 
     # Error rate
@@ -78,10 +85,8 @@ for i in range(100):
         print("Asking AI for analysis...")
 
         analysis = r.chat(
-            "Analyze the data pipeline performance. "
-            "Is the error rate acceptable? "
-            "Is processing time consistent? "
-            "Give a brief assessment."
+            f"Checkpoint at record {record_id}: {records_processed} processed, "
+            f"{errors} errors ({error_rate:.1f}%), avg time {avg_time:.3f}s."
         )
 
         print(f"\n🤖 AI Analysis:\n{analysis}\n")
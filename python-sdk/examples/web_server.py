@@ -6,67 +6,102 @@ This demonstrates using r.chat() to generate dynamic content inline.
 Run with: reflexive --debug web_server.py
 """
 
+import os
+import socket
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 import reflexive
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 
-# Create Reflexive instance
-r = reflexive.make_reflexive()
-
-# Track stats
+# Create Reflexive instance (the story instructions are a cacheable prefix)
+r = reflexive.make_reflexive({
+    'cacheable_prefix': [
+        'You write stories for a web page. Reply with a very short (3-4 sentences) '
+        'story about the topic you are given, with no preamble.'
+    ],
+    # Remember stories across restarts so repeat topics are served instantly.
+    # Only the same topic (ignoring case and spacing) reuses a story; fuzzy
+    # matching (chat_cache_threshold) stays off for free-form user input.
+    'chat_cache_path': os.path.join(tempfile.gettempdir(), 'reflexive-stories.db'),
+    'chat_cache_ttl': 24 * 60 * 60,
+})
+
+# Track stats (requests are handled on separate threads)
 request_count = 0
 story_count = 0
+stats_lock = threading.Lock()
+
+# Bound how many stories are generated at once; request threads wait for a slot
+chat_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix='story-chat')
+
+# Home page is static apart from the stats line, so encode it once up front
+_HOME_PREFIX = """
+<html>
+<head><title>AI Story Generator</title></head>
+<body style="font-family: sans-serif; max-width: 800px; margin: 50px auto;">
+    <h1>🤖 AI Story Generator</h1>
+    <p>Powered by Reflexive + Claude</p>
+    <p>Try: <a href="/story?topic=space+adventure">/story?topic=space+adventure</a></p>
+    <p>Or: <a href="/story?topic=mystery+detective">/story?topic=mystery+detective</a></p>
+    <hr>
+    <p><b>Stats:</b> """.encode('utf-8')
+_HOME_SUFFIX = b""" stories generated</p>
+</body>
+</html>
+"""
 
 
 class StoryHandler(BaseHTTPRequestHandler):
+    # Buffer wfile (the default writes straight to the socket) so headers and
+    # body go out together when the handler finishes, instead of one send each
+    wbufsize = 64 * 1024
+
     def log_message(self, format, *args):
         # Use reflexive logging instead of default
         r.log('info', f'{self.address_string()} - {format % args}')
 
+    def send_page(self, status, content_type, *chunks):
+        """Send a complete response made of pre-encoded body chunks"""
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(sum(len(chunk) for chunk in chunks)))
+        self.end_headers()
+        for chunk in chunks:
+            self.wfile.write(chunk)
+
     def do_GET(self):
         global request_count, story_count
 
-        request_count += 1
-        r.set_state('requests.total', request_count)
+        with stats_lock:
+            request_count += 1
+            total_requests = request_count
+            total_stories = story_count
+        r.set_state('requests.total', total_requests)
 
         parsed = urlparse(self.path)
 
         if parsed.path == '/':
             # Home page
-            self.send_response(200)
-            self.send_header('Content-Type', 'text/html')
-            self.end_headers()
-
-            html = f"""
-            <html>
-            <head><title>AI Story Generator</title></head>
-            <body style="font-family: sans-serif; max-width: 800px; margin: 50px auto;">
-                <h1>🤖 AI Story Generator</h1>
-                <p>Powered by Reflexive + Claude</p>
-                <p>Try: <a href="/story?topic=space+adventure">/story?topic=space+adventure</a></p>
-                <p>Or: <a href="/story?topic=mystery+detective">/story?topic=mystery+detective</a></p>
-                <hr>
-                <p><b>Stats:</b> {request_count} requests, {story_count} stories generated</p>
-            </body>
-            </html>
-            """
-            self.wfile.write(html.encode('utf-8'))
+            stats = f'{total_requests} requests, {total_stories}'.encode('ascii')
+            self.send_page(200, 'text/html', _HOME_PREFIX, stats, _HOME_SUFFIX)
 
         elif parsed.path == '/story':
             # Generate AI story
             query_params = parse_qs(parsed.query)
             topic = query_params.get('topic', ['random'])[0]
 
-            story_count += 1
-            r.set_state('stories.generated', story_count)
+            with stats_lock:
+                story_count += 1
+                total_stories = story_count
+            r.set_state('stories.generated', total_stories)
 
             # Use AI inline to generate the story!
             r.log('info', f'Generating story about: {topic}')
-            story = r.chat(f'Write a very short (3-4 sentences) story about: {topic}')
-
-            self.send_response(200)
-            self.send_header('Content-Type', 'text/html')
-            self.end_headers()
+            story = chat_pool.submit(partial(r.chat, f'Story topic: {topic}', cache=True)).result()
 
             html = f"""
             <html>
@@ -80,19 +115,29 @@ class StoryHandler(BaseHTTPRequestHandler):
             </body>
             </html>
             """
-            self.wfile.write(html.encode('utf-8'))
+            self.send_page(200, 'text/html', html.encode('utf-8'))
 
         else:
             # 404
-            self.send_response(404)
-            self.send_header('Content-Type', 'text/plain')
-            self.end_headers()
-            self.wfile.write(b'Not Found')
+            self.send_page(404, 'text/plain', b'Not Found')
+
+
+class StoryServer(ThreadingHTTPServer):
+    """Thread-per-request server, so one slow story doesn't block other requests"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def server_bind(self):
+        # Let several server processes share the port where supported
+        if hasattr(socket, 'SO_REUSEPORT'):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
 
 
 if __name__ == '__main__':
     port = 8080
-    server = HTTPServer(('', port), StoryHandler)
+    server = StoryServer(('', port), StoryHandler)
 
     print(f"🚀 AI Story Server running on http://localhost:{port}")
     print(f"📊 Run with: reflexive --debug web_server.py")
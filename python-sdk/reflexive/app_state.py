@@ -1,13 +1,48 @@
 """Application state management for Reflexive"""
 
 import os
+import re
 import time
 from collections import deque
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Deque
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Dict, Iterator, List, NoReturn, Optional, Deque, Pattern, Sequence, Tuple
 
 from .types import LogEntry, LogType, AppStatus, get_memory_usage
 
+# Snapshot of the log columns: (types, messages, timestamps, metas)
+_LogColumns = Tuple[List[str], List[str], List[float], List[Optional[Dict[str, Any]]]]
+
+# Immutable value types that set_state() can safely compare to skip no-op updates.
+# Containers are always treated as changed, since they may have been mutated in place.
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+class _ReadOnlyDict(Dict[str, Any]):
+    """
+    dict that refuses modification
+
+    Used for the customState snapshot shared between get_status() calls. It
+    is still a dict, so json.dumps() and friends serialize it as usual.
+    """
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("customState is a read-only snapshot; copy it with dict() to modify")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore[assignment]
+
+    def __reduce__(self) -> Any:
+        # Pickle and deepcopy rebuild from a plain dict instead of setting items
+        return (_ReadOnlyDict, (dict(self),))
+
+
+@lru_cache(maxsize=64)
+def _compile(query: str) -> Pattern[str]:
+    """Compile a search pattern, reusing it for repeated queries"""
+    return re.compile(query)
+
 
 class AppState:
     """Manages application logs and custom state"""
@@ -19,10 +54,20 @@ class AppState:
         Args:
             max_logs: Maximum number of log entries to keep (default: 500)
         """
-        self._logs: Deque[LogEntry] = deque(maxlen=max_logs)
+        # Logs are stored column-wise so filters only walk the column they test
+        self._log_types: Deque[str] = deque(maxlen=max_logs)
+        self._log_messages: Deque[str] = deque(maxlen=max_logs)
+        self._log_timestamps: Deque[float] = deque(maxlen=max_logs)
+        self._log_metas: Deque[Optional[Dict[str, Any]]] = deque(maxlen=max_logs)
+        self._log_lock = Lock()
         self._custom_state: Dict[str, Any] = {}
+        # Bumped on every state change, so get_status() can reuse its snapshot
+        self._state_version = 0
+        self._status_state: Tuple[int, Dict[str, Any]] = (0, _ReadOnlyDict())
         self._start_time = time.time()
         self._pid = os.getpid()
+        # (second, ISO prefix) of the last formatted timestamp
+        self._ts_prefix: Tuple[int, str] = (-1, "")
 
     def log(self, log_type: str, message: str, meta: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -33,13 +78,42 @@ class AppState:
             message: Log message
             meta: Optional metadata dictionary
         """
-        entry: LogEntry = {
-            "type": log_type,
-            "message": message,
-            "timestamp": datetime.now().isoformat(),
-            "meta": meta,
+        # Timestamps are formatted lazily, when logs are read
+        timestamp = time.time()
+        with self._log_lock:
+            self._log_types.append(log_type)
+            self._log_messages.append(message)
+            self._log_timestamps.append(timestamp)
+            self._log_metas.append(meta)
+
+    def _snapshot(self) -> _LogColumns:
+        """Copy the log columns, consistent with each other"""
+        with self._log_lock:
+            return (
+                list(self._log_types),
+                list(self._log_messages),
+                list(self._log_timestamps),
+                list(self._log_metas),
+            )
+
+    def _format_timestamp(self, ts: float) -> str:
+        """Format a unix timestamp as local ISO 8601, reusing the per-second prefix"""
+        sec = int(ts)
+        cached_sec, prefix = self._ts_prefix
+        if sec != cached_sec:
+            prefix = datetime.fromtimestamp(sec).isoformat()
+            self._ts_prefix = (sec, prefix)
+        return f"{prefix}.{int((ts - sec) * 1_000_000):06d}"
+
+    def _to_entry(self, columns: _LogColumns, i: int) -> LogEntry:
+        """Build a LogEntry from one row of a column snapshot"""
+        types, messages, timestamps, metas = columns
+        return {
+            "type": types[i],
+            "message": messages[i],
+            "timestamp": self._format_timestamp(timestamps[i]),
+            "meta": metas[i],
         }
-        self._logs.append(entry)
 
     def get_logs(self, count: Optional[int] = None, log_type: Optional[str] = None) -> List[LogEntry]:
         """
@@ -52,19 +126,21 @@ class AppState:
         Returns:
             List of log entries
         """
-        logs = list(self._logs)
+        columns = self._snapshot()
+        types = columns[0]
 
         # Filter by type if specified
+        indices: Sequence[int] = range(len(types))
         if log_type:
-            logs = [log for log in logs if log["type"] == log_type]
+            indices = [i for i, t in enumerate(types) if t == log_type]
 
         # Return most recent logs
         if count is not None:
-            logs = logs[-count:]
+            indices = indices[-count:]
 
-        return logs
+        return [self._to_entry(columns, i) for i in indices]
 
-    def search_logs(self, query: str) -> List[LogEntry]:
+    def search_logs(self, query: str) -> Iterator[LogEntry]:
         """
         Search logs by regex pattern
 
@@ -72,21 +148,41 @@ class AppState:
             query: Regex pattern to search for
 
         Returns:
-            List of matching log entries
+            Iterator over matching log entries (oldest first)
         """
-        import re
-        pattern = re.compile(query)
-        return [log for log in self._logs if pattern.search(log["message"])]
-
-    def set_state(self, key: str, value: Any) -> None:
+        pattern = _compile(query)
+        # Snapshot so logging during iteration can't mutate the columns underneath us
+        columns = self._snapshot()
+        return (
+            self._to_entry(columns, i)
+            for i, message in enumerate(columns[1])
+            if pattern.search(message)
+        )
+
+    def set_state(self, key: str, value: Any, tolerance: Optional[float] = None) -> bool:
         """
         Set custom state value
 
         Args:
             key: State key (supports dot notation like 'users.count')
             value: State value
+            tolerance: For float values, ignore changes no larger than this
+
+        Returns:
+            True if the stored value changed, False if the update was a no-op
         """
+        if key in self._custom_state:
+            current = self._custom_state[key]
+            if type(current) is type(value) and isinstance(value, _SCALAR_TYPES):
+                if tolerance is not None and isinstance(value, float):
+                    if abs(value - current) <= tolerance:
+                        return False
+                elif value == current:
+                    return False
+
         self._custom_state[key] = value
+        self._state_version += 1
+        return True
 
     def get_state(self, key: Optional[str] = None) -> Any:
         """
@@ -107,12 +203,20 @@ class AppState:
         Get application status snapshot
 
         Returns:
-            AppStatus dictionary with current process info
+            AppStatus dictionary with current process info. customState is a
+            read-only dict, shared between calls until the state changes; it
+            serializes like any dict (e.g. json.dumps(status)).
         """
+        version, custom_state = self._status_state
+        if version != self._state_version:
+            version = self._state_version
+            custom_state = _ReadOnlyDict(self._custom_state)
+            self._status_state = (version, custom_state)
+
         return {
             "pid": self._pid,
             "uptime": time.time() - self._start_time,
             "memory": get_memory_usage(),
-            "customState": self._custom_state.copy(),
+            "customState": custom_state,
             "startTime": self._start_time,
         }
@@ -0,0 +1,300 @@
+"""Response cache for Reflexive chat"""
+
+import hashlib
+import json
+import math
+import re
+import time
+from collections import Counter, OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Iterable, Optional, Tuple, cast
+
+if TYPE_CHECKING:
+    import sqlite3
+
+_WORD_RE = re.compile(r"\w+")
+_SPACE_RE = re.compile(r"\s+")
+# Sentence punctuation at the end of a word ("pipeline." / "acceptable?"); "5.5" is kept
+_TRAILING_PUNCT_RE = re.compile(r"[.,:;!?]+(?=\s|$)")
+
+# Words too common to say anything about what a prompt asks
+_STOP_WORDS = frozenset(
+    "a an and are as at be by for from has have how i in is it its of on or so that the "
+    "their there this to was were what when which who why will with you your".split()
+)
+# Words that flip a prompt's meaning ("t" is the tail of "isn't", "don't", ...)
+_NEGATIONS = frozenset("no not nor never none nothing without cannot t".split())
+
+# Term-frequency vector, its L2 norm, and the tokens that must match exactly
+# (numbers and negations) for two prompts to count as similar
+Embedding = Tuple[Dict[str, int], float, FrozenSet[str]]
+
+# Maximum rows kept in a persistent cache file (oldest are pruned on open)
+_MAX_DISK_ENTRIES = 10_000
+
+
+def normalize(text: str) -> str:
+    """
+    Normalize a prompt for exact matching
+
+    Ignores case, runs of whitespace and sentence punctuation, so
+    "Is it OK?" and "is it ok" share a cache entry.
+    """
+    text = _TRAILING_PUNCT_RE.sub("", text.strip().lower())
+    return _SPACE_RE.sub(" ", text)
+
+
+def embed(text: str) -> Embedding:
+    """
+    Build a bag-of-words embedding for a prompt
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        (term counts, vector norm, anchor tokens) tuple
+    """
+    words = [w for w in _WORD_RE.findall(text.lower()) if w not in _STOP_WORDS]
+    counts = dict(Counter(words))
+    norm = math.sqrt(sum(c * c for c in counts.values()))
+    anchors = frozenset(w for w in counts if w in _NEGATIONS or any(c.isdigit() for c in w))
+    return counts, norm, anchors
+
+
+def prompt_namespace(system_prompt: Optional[str] = None, prefixes: Iterable[str] = ()) -> str:
+    """
+    Build a cache namespace from the static prompt content
+
+    Responses depend on the system prompt and cacheable prefixes as well as
+    the message, so caches built with different ones must not share entries.
+
+    Args:
+        system_prompt: System prompt sent with each message
+        prefixes: Cacheable prefix blocks sent with each message
+
+    Returns:
+        Hex digest identifying the prompt configuration
+    """
+    parts = [system_prompt or ""] + list(prefixes)
+    return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()
+
+
+def _hash(namespace: str, prompt: str) -> str:
+    """Stable key for a prompt in the persistent cache"""
+    return hashlib.sha256(f"{namespace}\0{prompt}".encode("utf-8")).hexdigest()
+
+
+def similarity(a: Embedding, b: Embedding) -> float:
+    """Cosine similarity between two embeddings (0 unless their anchor tokens agree)"""
+    a_counts, a_norm, a_anchors = a
+    b_counts, b_norm, b_anchors = b
+    if not a_norm or not b_norm or a_anchors != b_anchors:
+        return 0.0
+    if len(a_counts) > len(b_counts):
+        a_counts, b_counts = b_counts, a_counts
+    dot = sum(c * b_counts.get(term, 0) for term, c in a_counts.items())
+    return dot / (a_norm * b_norm)
+
+
+class ChatCache:
+    """
+    LRU cache of chat responses
+
+    When given a path, responses are also stored in a SQLite file so they
+    survive restarts. Lookups try an exact match in memory, then an exact
+    match on disk (by SHA-256 of the prompt). Prompts are compared after
+    normalize(), so case, spacing and sentence punctuation don't matter.
+
+    Fuzzy matching is opt-in: with a threshold, a miss falls back to the most
+    similar prompt held in memory. Bag-of-words similarity can't tell "a
+    knight fights a dragon" from "a knight fights a wizard" once prompts get
+    long, so only enable it for prompts whose wording varies but whose
+    meaning doesn't, and keep the threshold high (0.95 or more). Prompts
+    that differ in a number or a negation never match.
+
+    Entries are scoped to a namespace (see prompt_namespace()). Memory only ever
+    holds entries for the cache's own namespace, and on disk the namespace
+    is part of each row's hash, so apps with different prompts can share a
+    cache file without serving each other's responses.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        threshold: Optional[float] = None,
+        path: Optional[str] = None,
+        ttl: Optional[float] = None,
+        namespace: str = "",
+    ):
+        """
+        Initialize ChatCache
+
+        Args:
+            max_entries: Maximum number of responses held in memory (default: 128)
+            threshold: Minimum cosine similarity for a fuzzy hit (default: exact only)
+            path: SQLite file for a persistent cache (default: memory only)
+            ttl: Seconds before a cached response expires (default: never)
+            namespace: Prompt configuration the responses belong to (default: none)
+        """
+        self._entries: "OrderedDict[str, Tuple[Optional[Embedding], str, float]]" = OrderedDict()
+        self._max_entries = max_entries
+        self._threshold = threshold
+        self._ttl = ttl
+        self._namespace = namespace
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._db: Optional["sqlite3.Connection"] = None
+
+        if path:
+            self._open(path)
+
+    def _open(self, path: str) -> None:
+        """Open the cache file and load its most recent responses into memory"""
+        import sqlite3
+
+        try:
+            db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        except sqlite3.Error:
+            return  # Unusable cache file; fall back to memory only
+
+        try:
+            columns = {row[1] for row in db.execute("PRAGMA table_info(responses)")}
+            if columns and "namespace" not in columns:
+                # Written before entries were namespaced; it's only a cache, so start over
+                db.execute("DROP TABLE responses")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "hash TEXT PRIMARY KEY, namespace TEXT NOT NULL, prompt TEXT NOT NULL, "
+                "response TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            if self._ttl is not None:
+                db.execute("DELETE FROM responses WHERE created < ?", (time.time() - self._ttl,))
+            db.execute(
+                "DELETE FROM responses WHERE hash NOT IN "
+                "(SELECT hash FROM responses ORDER BY created DESC LIMIT ?)",
+                (_MAX_DISK_ENTRIES,),
+            )
+            rows = db.execute(
+                "SELECT prompt, response, created FROM responses WHERE namespace = ? "
+                "ORDER BY created DESC LIMIT ?",
+                (self._namespace, self._max_entries),
+            ).fetchall()
+        except sqlite3.Error:
+            # Unusable cache file; fall back to memory only
+            db.close()
+            return
+
+        self._db = db
+        for prompt, response, created in reversed(rows):
+            self._remember(prompt, response, created)
+
+    def _expired(self, created: float) -> bool:
+        """Check whether a response cached at `created` has outlived the TTL"""
+        return self._ttl is not None and time.time() - created > self._ttl
+
+    def _remember(self, key: str, response: str, created: float) -> None:
+        """Add a response to the in-memory LRU"""
+        embedding = embed(key) if self._threshold is not None else None
+        self._entries[key] = (embedding, response, created)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _lookup(self, key: str) -> Optional[str]:
+        """Find a cached response for a normalized prompt (lock must be held)"""
+        # 1. Exact match in memory
+        entry = self._entries.get(key)
+        if entry is not None:
+            if not self._expired(entry[2]):
+                self._entries.move_to_end(key)
+                return entry[1]
+            del self._entries[key]
+
+        # 2. Exact match on disk (covers entries evicted from memory)
+        if self._db is not None:
+            try:
+                row = self._db.execute(
+                    "SELECT response, created FROM responses WHERE hash = ?",
+                    (_hash(self._namespace, key),),
+                ).fetchone()
+            except Exception:
+                row = None  # The disk tier is best effort
+            if row is not None and not self._expired(row[1]):
+                response = cast(str, row[0])
+                self._remember(key, response, row[1])
+                return response
+
+        # 3. Most similar prompt in memory (only if fuzzy matching is enabled)
+        if self._threshold is None:
+            return None
+        query = embed(key)
+        best = self._threshold
+        match_key: Optional[str] = None
+        for cached_key, (embedding, _, created) in self._entries.items():
+            if embedding is None:
+                continue
+            score = similarity(query, embedding)
+            if score >= best and not self._expired(created):
+                best, match_key = score, cached_key
+
+        if match_key is None:
+            return None
+        self._entries.move_to_end(match_key)
+        return self._entries[match_key][1]
+
+    def get(self, message: str) -> Optional[str]:
+        """
+        Look up a cached response for a message
+
+        Args:
+            message: Chat message
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        key = normalize(message)
+        with self._lock:
+            response = self._lookup(key)
+            if response is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return response
+
+    def put(self, message: str, response: str) -> None:
+        """
+        Cache a response for a message
+
+        Args:
+            message: Chat message
+            response: AI response
+        """
+        key = normalize(message)
+        created = time.time()
+        with self._lock:
+            self._remember(key, response, created)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                        (_hash(self._namespace, key), self._namespace, key, response, created),
+                    )
+                except Exception:
+                    pass  # The disk tier is best effort
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with hits, misses, hit_rate and size
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+            }
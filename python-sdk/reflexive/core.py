@@ -9,17 +9,91 @@ Matches the TypeScript makeReflexive() pattern:
 import os
 import sys
 import json
+import queue
 import logging
-import subprocess
 import atexit
-from typing import Optional, Any, Dict
-from threading import Thread
-import urllib.request
+import warnings
+import weakref
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Optional, Any, Callable, Dict, Iterator, List, Tuple, cast
+from threading import Thread, local
 import time
 
+# asyncio, http.client and subprocess are imported where they are used: they are
+# comparatively slow to import and many apps never need them
+if TYPE_CHECKING:
+    import http.client
+    import subprocess
+
+try:
+    import orjson
+except ImportError:  # Optional speedup: pip install reflexive[fast]
+    orjson = None  # type: ignore[assignment]
+
 from .app_state import AppState
+from .chat_cache import ChatCache, prompt_namespace
 from .types import MakeReflexiveOptions
 
+# Both parsers accept bytes and raise ValueError subclasses on bad input
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Encode a request body as UTF-8 JSON bytes"""
+    if orjson is not None:
+        try:
+            return cast(bytes, orjson.dumps(
+                obj, default=default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ))
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits; the stdlib encoder handles those
+    return json.dumps(obj, default=default).encode("utf-8")
+
+
+def _encode_state_updates(updates: Dict[str, Any]) -> bytes:
+    """
+    Encode a batch of state updates as a /client-state-batch body
+
+    Values JSON can't represent are sent as their str(), and any value that
+    still fails to encode is dropped on its own rather than losing the batch.
+    """
+    try:
+        return _json_dumps({"updates": updates}, default=str)
+    except (TypeError, ValueError):
+        pass
+
+    encodable: Dict[str, Any] = {}
+    for key, value in updates.items():
+        try:
+            _json_dumps(value, default=str)
+        except (TypeError, ValueError):
+            continue  # e.g. a circular reference
+        encodable[key] = value
+    return _json_dumps({"updates": encodable}, default=str)
+
+# State sync batching: set_state() calls are queued for a background worker that
+# coalesces them (last write wins per key) into one /client-state-batch POST
+_STATE_QUEUE_SIZE = 1024  # queued updates before set_state() starts dropping them
+_STATE_FLUSH_INTERVAL = 0.02  # seconds to wait for more updates before flushing
+_STATE_BATCH_SIZE = 64  # flush immediately once this many keys are pending
+_STATE_EXIT_TIMEOUT = 2.0  # seconds to wait at exit for the final state sync
+
+# Idle keep-alive connections kept open to the CLI (shared by chat and state sync)
+_MAX_KEEPALIVE_CONNECTIONS = 8
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Characters of stdout/stderr buffered without a newline before they are logged anyway
+_MAX_PARTIAL_LINE = 64 * 1024
+
+# Python logging levels mapped to Reflexive log types
+_LEVEL_MAP = {
+    logging.DEBUG: "debug",
+    logging.INFO: "info",
+    logging.WARNING: "warn",
+    logging.ERROR: "error",
+    logging.CRITICAL: "critical",
+}
+
 
 class ReflexiveInstance:
     """
@@ -31,7 +105,7 @@ class ReflexiveInstance:
     def __init__(
         self,
         app_state: AppState,
-        cli_process: Optional[subprocess.Popen] = None,
+        cli_process: Optional["subprocess.Popen"] = None,
         cli_port: Optional[int] = None,
         options: Optional[Dict[str, Any]] = None
     ):
@@ -41,6 +115,36 @@ class ReflexiveInstance:
         self.options = options or {}
         self.logger = logging.getLogger(__name__)
 
+        # Responses for chat(..., cache=True)
+        self._chat_cache = ChatCache(
+            max_entries=self.options.get("chat_cache_size", 128),
+            threshold=self.options.get("chat_cache_threshold"),
+            path=self.options.get("chat_cache_path"),
+            ttl=self.options.get("chat_cache_ttl"),
+            namespace=prompt_namespace(
+                self.options.get("system_prompt"), self.options.get("cacheable_prefix") or ()
+            ),
+        )
+
+        # Pool of idle keep-alive connections to the CLI
+        self._idle_connections: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue(
+            maxsize=_MAX_KEEPALIVE_CONNECTIONS
+        )
+
+        # State updates waiting for the sync worker; set_state() never blocks on it.
+        # None is the stop signal queued at exit.
+        self._sync_queue: "queue.Queue[Optional[Tuple[str, Any]]]" = queue.Queue(
+            maxsize=_STATE_QUEUE_SIZE
+        )
+        self._sync_overflow = False
+
+        if cli_port:
+            self._sync_thread = Thread(
+                target=self._sync_worker, name="reflexive-state-sync", daemon=True
+            )
+            self._sync_thread.start()
+            atexit.register(self._stop_sync)
+
         # Register cleanup if we spawned a CLI process
         if cli_process:
             atexit.register(self._cleanup)
@@ -61,13 +165,31 @@ class ReflexiveInstance:
         """Add a log entry"""
         self.app_state.log(log_type, message)
 
-    def set_state(self, key: str, value: Any) -> None:
-        """Set custom state (syncs to CLI if running in child mode)"""
-        self.app_state.set_state(key, value)
+    def set_state(self, key: str, value: Any, tolerance: Optional[float] = None) -> None:
+        """
+        Set custom state (syncs to CLI if running in child mode)
+
+        Setting a key to the value it already holds is a no-op and is not
+        synced. Pass tolerance to also ignore small changes to float values.
+        """
+        changed = self.app_state.set_state(key, value, tolerance)
+
+        # Queue for the next batched sync to CLI (fire and forget)
+        if changed and self._cli_port:
+            try:
+                self._sync_queue.put_nowait((key, value))
+            except queue.Full:
+                # Dropped; the worker resyncs the full state on its next flush
+                self._sync_overflow = True
 
-        # Sync to CLI if available (fire and forget)
-        if self._cli_port:
-            self._sync_state_to_cli(key, value)
+    async def aset_state(self, key: str, value: Any, tolerance: Optional[float] = None) -> None:
+        """
+        Async variant of set_state() for symmetry with achat()
+
+        set_state() only queues the update for the background sync thread,
+        so it never blocks the event loop and is also safe to call directly.
+        """
+        self.set_state(key, value, tolerance)
 
     def get_state(self, key: Optional[str] = None) -> Any:
         """Get custom state"""
@@ -77,80 +199,273 @@ class ReflexiveInstance:
         """Get log entries"""
         return self.app_state.get_logs(count, log_type)
 
-    def chat(self, message: str) -> str:
+    def chat(self, message: str, cache: bool = False) -> str:
         """
         Send a message to the AI and get a response
 
         Args:
             message: Message to send to the AI
+            cache: Reuse the response of an identical or near-identical
+                earlier message instead of asking the AI again
 
         Returns:
             AI response as a string
         """
-        if self._cli_port:
-            return self._chat_via_http(message)
-        else:
+        if not self._cli_port:
             return "Error: Chat requires running under Reflexive CLI (run: reflexive app.py)"
 
-    def _chat_via_http(self, message: str) -> str:
-        """Send chat request to parent CLI via HTTP (matches TypeScript pattern)"""
+        if cache:
+            cached = self._chat_cache.get(message)
+            if cached is not None:
+                return cached
+
+        _warn_if_event_loop_running("chat")
+        response, ok = self._chat_via_http(message)
+
+        # Only cache real answers, never errors or the "No response" placeholder
+        if cache and ok:
+            self._chat_cache.put(message, response)
+        return response
+
+    async def achat(self, message: str, cache: bool = False) -> str:
+        """
+        Async variant of chat() for use inside an event loop
+
+        The blocking HTTP call runs in the loop's default executor, so the
+        event loop keeps serving other tasks while the AI responds.
+
+        Args:
+            message: Message to send to the AI
+            cache: Reuse cached responses (see chat())
+
+        Returns:
+            AI response as a string
+        """
+        import asyncio
+
+        # run_in_executor rather than asyncio.to_thread (3.9+) to support Python 3.8
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.chat, message, cache)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Get chat response cache statistics (hits, misses, hit_rate, size)"""
+        return self._chat_cache.stats()
+
+    @contextmanager
+    def _post(self, path: str, data: bytes, timeout: float) -> Iterator["http.client.HTTPResponse"]:
+        """POST to the parent CLI over a pooled keep-alive connection"""
+        conn, response = self._send(path, data, timeout)
+
         try:
-            url = f"http://localhost:{self._cli_port}/chat"
-            headers = {"Content-Type": "application/json"}
-            data = json.dumps({"message": message}).encode("utf-8")
+            yield response
+            response.read()  # Drain so the connection can be reused
+        except BaseException:
+            conn.close()
+            raise
+
+        if response.will_close:
+            conn.close()
+            return
+        try:
+            self._idle_connections.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def _send(
+        self, path: str, data: bytes, timeout: float
+    ) -> Tuple["http.client.HTTPConnection", "http.client.HTTPResponse"]:
+        """Send a POST, preferring an idle pooled connection, and return it with its response"""
+        import http.client
+
+        try:
+            conn = self._idle_connections.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            try:
+                return conn, _request(conn, path, data, timeout)
+            except (http.client.HTTPException, ConnectionError):
+                # The CLI may have closed an idle keep-alive connection; retry on a fresh one
+                pass
+
+        conn = http.client.HTTPConnection("localhost", self._cli_port, timeout=timeout)
+        return conn, _request(conn, path, data, timeout)
+
+    def _chat_via_http(self, message: str) -> Tuple[str, bool]:
+        """
+        Send chat request to parent CLI via HTTP (matches TypeScript pattern)
 
-            req = urllib.request.Request(url, data=data, headers=headers, method="POST")
+        Returns:
+            (text, ok) tuple; ok is False when text is an error or placeholder
+        """
+        try:
+            payload: Dict[str, Any] = {"message": message}
+            # Static prompt content the CLI places ahead of the dynamic message,
+            # so the provider can reuse its prompt cache across calls
+            if self.options.get("system_prompt"):
+                payload["system"] = self.options["system_prompt"]
+            if self.options.get("cacheable_prefix"):
+                payload["cache_prefixes"] = list(self.options["cacheable_prefix"])
+            data = _json_dumps(payload)
 
             # Read SSE response
-            with urllib.request.urlopen(req, timeout=60) as response:
-                full_response = ""
+            with self._post("/chat", data, timeout=60) as response:
+                if response.status != 200:
+                    return f"Error: HTTP {response.status} {response.reason}", False
+
+                # Parse SSE lines as raw bytes and join text chunks once at the end
+                parts = []
                 for line in response:
-                    line_str = line.decode("utf-8")
-                    if line_str.startswith("data: "):
+                    if line.startswith(b"data: "):
                         try:
-                            chunk = json.loads(line_str[6:])
-                            if chunk.get("type") == "text":
-                                full_response += chunk.get("content", "")
-                        except json.JSONDecodeError:
-                            pass
+                            chunk = _json_loads(line[6:])
+                        except ValueError:
+                            continue
+                        if chunk.get("type") == "text":
+                            parts.append(chunk.get("content", ""))
 
-                return full_response or "No response"
+                text = "".join(parts)
+                if not text:
+                    return "No response", False
+                return text, True
 
         except Exception as e:
-            return f"Error: {str(e)}"
+            return f"Error: {str(e)}", False
+
+    def _sync_worker(self) -> None:
+        """Background thread that drains queued state updates and syncs them in batches"""
+        while True:
+            item = self._sync_queue.get()
+            if item is None:
+                self._flush_state({})
+                return
+            updates = {item[0]: item[1]}
+
+            # Give a burst of set_state() calls a moment to coalesce
+            stopping = False
+            deadline = time.monotonic() + _STATE_FLUSH_INTERVAL
+            while len(updates) < _STATE_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._sync_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                updates[item[0]] = item[1]
+
+            if self._flush_state(updates) or stopping:
+                return
+
+    def _flush_state(self, updates: Dict[str, Any]) -> bool:
+        """
+        Send a batch plus any other queued state updates to the CLI in one request
+
+        Returns:
+            True if the stop signal was among the queued updates
+        """
+        stopping = False
+        while True:
+            try:
+                item = self._sync_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                stopping = True
+            else:
+                updates[item[0]] = item[1]
+
+        if self._sync_overflow:
+            # Some updates were dropped; send the whole state so the CLI catches up
+            self._sync_overflow = False
+            updates.update(self.app_state.get_state())
+
+        if updates:
+            self._sync_state_to_cli(updates)
+        return stopping
+
+    def _stop_sync(self) -> None:
+        """
+        Flush pending state at exit
 
-    def _sync_state_to_cli(self, key: str, value: Any) -> None:
-        """Sync state to parent CLI (fire and forget, matches TypeScript pattern)"""
+        The worker is the only thread that posts state, so the final values
+        can't be overtaken by an older batch. It is told to stop, sends the
+        batch it is holding plus everything still queued, and is waited for.
+        """
         try:
-            url = f"http://localhost:{self._cli_port}/client-state"
-            headers = {"Content-Type": "application/json"}
-            data = json.dumps({"key": key, "value": value}).encode("utf-8")
+            self._sync_queue.put(None, timeout=_STATE_EXIT_TIMEOUT)
+        except queue.Full:
+            return
+        self._sync_thread.join(timeout=_STATE_EXIT_TIMEOUT)
 
-            req = urllib.request.Request(url, data=data, headers=headers, method="POST")
-            urllib.request.urlopen(req, timeout=1)
+    def _sync_state_to_cli(self, updates: Dict[str, Any]) -> None:
+        """Sync a batch of state updates to parent CLI (fire and forget)"""
+        try:
+            data = _encode_state_updates(updates)
+            with self._post("/client-state-batch", data, timeout=1):
+                pass
         except Exception:
             # Silently ignore sync errors (fire and forget)
             pass
 
 
-def _create_client_reflexive(cli_port: int) -> ReflexiveInstance:
+def _request(
+    conn: "http.client.HTTPConnection", path: str, data: bytes, timeout: float
+) -> "http.client.HTTPResponse":
+    """POST a JSON body on a connection, closing it if the request fails"""
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+
+    try:
+        conn.request("POST", path, body=data, headers=_JSON_HEADERS)
+        return conn.getresponse()
+    except BaseException:
+        conn.close()
+        raise
+
+
+def _warn_if_event_loop_running(method: str) -> None:
+    """Warn when a blocking call is made from inside a running asyncio event loop"""
+    # If asyncio was never imported, no event loop can be running
+    asyncio = sys.modules.get("asyncio")
+    if asyncio is None:
+        return
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    warnings.warn(
+        f"{method}() blocks the running event loop until the AI responds; "
+        f"use 'await r.a{method}(...)' in async code",
+        RuntimeWarning,
+        stacklevel=3,
+    )
+
+
+def _create_client_reflexive(cli_port: int, options: Dict[str, Any]) -> ReflexiveInstance:
     """
     Create a client-mode Reflexive instance that connects to parent CLI
 
     This is used when the app is run via `reflexive app.py` (matches TypeScript pattern)
     """
-    app_state = AppState()
+    app_state = AppState(max_logs=options.get("max_logs", 500))
     print(f"[reflexive] Running in CLI child mode, connecting to parent on port {cli_port}")
 
-    return ReflexiveInstance(app_state=app_state, cli_port=cli_port)
+    return ReflexiveInstance(app_state=app_state, cli_port=cli_port, options=options)
 
 
-def _spawn_cli_process(entry_file: str, options: Dict[str, Any]) -> Optional[subprocess.Popen]:
+def _spawn_cli_process(entry_file: str, options: Dict[str, Any]) -> Optional["subprocess.Popen"]:
     """
     Spawn the Node.js Reflexive CLI as a background process
 
     Returns the process if successful, None otherwise
     """
+    import subprocess
+
     # Build CLI command
     cli_cmd = ["npx", "reflexive"]
 
@@ -210,6 +525,13 @@ def make_reflexive(options: Optional[MakeReflexiveOptions] = None) -> ReflexiveI
             - shell: Enable shell access for spawned CLI (default: False)
             - port: Port for spawned CLI (default: 3099)
             - max_logs: Maximum log entries (default: 500)
+            - system_prompt: Additional system prompt for chat()
+            - cacheable_prefix: Static prompt text sent ahead of every chat() message
+            - chat_cache_size: Maximum cached chat responses (default: 128)
+            - chat_cache_threshold: Enable fuzzy cache hits at this prompt similarity
+              (default: exact matches only)
+            - chat_cache_path: SQLite file that persists cached responses (default: memory only)
+            - chat_cache_ttl: Seconds before a cached response expires (default: never)
 
     Returns:
         ReflexiveInstance with .chat(), .set_state(), etc.
@@ -233,7 +555,7 @@ def make_reflexive(options: Optional[MakeReflexiveOptions] = None) -> ReflexiveI
 
     if cli_mode and cli_port_str:
         cli_port = int(cli_port_str)
-        return _create_client_reflexive(cli_port)
+        return _create_client_reflexive(cli_port, cast(Dict[str, Any], opts))
 
     # Standalone mode
     max_logs = opts.get("max_logs", 500)
@@ -280,10 +602,17 @@ def _intercept_logging(app_state: AppState) -> None:
 
     class ReflexiveHandler(logging.Handler):
         def emit(self, record: logging.LogRecord) -> None:
-            log_type = record.levelname.lower()
-            if log_type == "warning":
-                log_type = "warn"
-            app_state.log(log_type, self.format(record))
+            try:
+                log_type = _LEVEL_MAP.get(record.levelno) or record.levelname.lower()
+                # The formatter is plain "%(message)s", so only run it when it has
+                # a traceback or stack to append
+                if record.exc_info or record.stack_info:
+                    message = self.format(record)
+                else:
+                    message = record.getMessage()
+                app_state.log(log_type, message)
+            except Exception:
+                self.handleError(record)
 
     # Add handler to root logger
     handler = ReflexiveHandler()
@@ -292,19 +621,90 @@ def _intercept_logging(app_state: AppState) -> None:
     handler.setFormatter(formatter)
     logging.root.addHandler(handler)
 
-    # Intercept stdout/stderr (similar to TypeScript console interception)
-    original_stdout = sys.stdout.write
-    original_stderr = sys.stderr.write
+    # Intercept stdout/stderr (similar to TypeScript console interception).
+    # Writes are buffered per thread until a newline so that print()'s separate
+    # text and "\n" writes become one log entry. The buffer is a list of chunks,
+    # joined only once a line completes, so output without newlines stays linear.
+    intercept_state = local()
+
+    class PartialLine:
+        """Text one thread has written to a stream since its last newline"""
 
-    def stdout_interceptor(text: str) -> int:
-        if text and text.strip():
-            app_state.log("stdout", text.rstrip())
-        return original_stdout(text)
+        __slots__ = ("chunks", "size", "__weakref__")
 
-    def stderr_interceptor(text: str) -> int:
-        if text and text.strip():
-            app_state.log("stderr", text.rstrip())
-        return original_stderr(text)
+        def __init__(self) -> None:
+            self.chunks: List[str] = []
+            self.size = 0
 
-    sys.stdout.write = stdout_interceptor  # type: ignore
-    sys.stderr.write = stderr_interceptor  # type: ignore
+    def log_text(log_type: str, text: str) -> None:
+        # Guard against re-entry if logging itself ends up writing to stdout/stderr
+        if getattr(intercept_state, "in_log", False):
+            return
+        intercept_state.in_log = True
+        try:
+            for line in text.split("\n"):
+                line = line.rstrip()
+                if line:
+                    app_state.log(log_type, line)
+        finally:
+            intercept_state.in_log = False
+
+    def log_leftover(log_type: str, chunks: List[str]) -> None:
+        # The thread ended (or the interpreter is exiting) mid-line
+        if chunks:
+            log_text(log_type, "".join(chunks))
+
+    def log_lines(log_type: str, text: str) -> None:
+        if getattr(intercept_state, "in_log", False):
+            return
+
+        partial: Optional[PartialLine] = getattr(intercept_state, log_type, None)
+        if partial is None:
+            partial = PartialLine()
+            setattr(intercept_state, log_type, partial)
+            # Thread-local data is released when its thread ends; log what's left then
+            weakref.finalize(partial, log_leftover, log_type, partial.chunks)
+        chunks = partial.chunks
+
+        end = text.rfind("\n")
+        if end < 0:
+            # No complete line yet (e.g. the text half of a print()); keep buffering
+            chunks.append(text)
+            partial.size += len(text)
+            if partial.size < _MAX_PARTIAL_LINE:
+                return
+            # Runaway output with no newline (progress dots, spinners); emit it anyway
+            pending, rest = "".join(chunks), ""
+        else:
+            chunks.append(text[:end])
+            pending, rest = "".join(chunks), text[end + 1:]
+
+        chunks.clear()
+        if rest:
+            chunks.append(rest)
+        partial.size = len(rest)
+        log_text(log_type, pending)
+
+    def flush_partial(log_type: str) -> None:
+        partial: Optional[PartialLine] = getattr(intercept_state, log_type, None)
+        if partial is not None and partial.chunks:
+            log_lines(log_type, "\n")
+
+    def intercept(stream: Any, log_type: str) -> None:
+        original_write: Callable[[str], int] = stream.write
+        original_flush: Callable[[], None] = stream.flush
+
+        def write_interceptor(text: str) -> int:
+            if text:
+                log_lines(log_type, text)
+            return original_write(text)
+
+        def flush_interceptor() -> None:
+            flush_partial(log_type)
+            original_flush()
+
+        stream.write = write_interceptor
+        stream.flush = flush_interceptor
+
+    intercept(sys.stdout, "stdout")
+    intercept(sys.stderr, "stderr")
@@ -1,9 +1,13 @@
 """Type definitions for Reflexive Python SDK"""
 
-from typing import Any, Dict, List, Literal, Optional, TypedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple, TypedDict
 from datetime import datetime
 import os
-import psutil
+import time
+
+# psutil is imported on first use (and not at all on Linux, which reads /proc)
+if TYPE_CHECKING:
+    import psutil
 
 # Log types
 LogType = Literal["info", "warn", "error", "debug", "stdout", "stderr", "system"]
@@ -32,18 +36,56 @@ class MakeReflexiveOptions(TypedDict, total=False):
     port: int  # Dashboard port (default: 3099)
     title: str  # Dashboard title
     system_prompt: str  # Additional system prompt for AI
+    cacheable_prefix: List[str]  # Static prompt text sent ahead of every chat() (prompt-cached)
+    chat_cache_size: int  # Maximum cached chat responses (default: 128)
+    chat_cache_threshold: float  # Enable fuzzy cache hits at this similarity (default: off)
+    chat_cache_path: str  # SQLite file that persists cached responses (default: memory only)
+    chat_cache_ttl: float  # Seconds before a cached response expires (default: never)
     # tools: List[CustomTool]  # Custom MCP tools (future)
     # on_ready: Callable  # Callback when ready (future)
 
 
+# Memory stats are re-read at most this often (nanoseconds)
+_MEMORY_REFRESH_NS = 100_000_000
+
+_STATM_PATH = "/proc/self/statm"
+_HAS_STATM = os.path.exists(_STATM_PATH)
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if _HAS_STATM else 0
+
+_process: Optional["psutil.Process"] = None
+_memory_cache: Tuple[int, Optional[Dict[str, int]]] = (0, None)
+
+
+def _read_statm() -> Dict[str, int]:
+    """Read memory usage straight from /proc/self/statm (Linux)"""
+    with open(_STATM_PATH, "rb") as f:
+        vms_pages, rss_pages = f.read().split()[:2]
+    return {"rss": int(rss_pages) * _PAGE_SIZE, "vms": int(vms_pages) * _PAGE_SIZE}
+
+
+def _read_psutil() -> Dict[str, int]:
+    """Read memory usage via a cached psutil.Process handle"""
+    import psutil
+
+    global _process
+    if _process is None or _process.pid != os.getpid():
+        _process = psutil.Process()
+    mem_info = _process.memory_info()
+    return {
+        "rss": mem_info.rss,  # Resident Set Size
+        "vms": mem_info.vms,  # Virtual Memory Size
+    }
+
+
 def get_memory_usage() -> Dict[str, int]:
-    """Get current process memory usage"""
-    try:
-        process = psutil.Process(os.getpid())
-        mem_info = process.memory_info()
-        return {
-            "rss": mem_info.rss,  # Resident Set Size
-            "vms": mem_info.vms,  # Virtual Memory Size
-        }
-    except Exception:
-        return {"rss": 0, "vms": 0}
+    """Get current process memory usage (re-read at most every 100ms)"""
+    global _memory_cache
+    now = time.monotonic_ns()
+    read_ns, usage = _memory_cache
+    if usage is None or now - read_ns > _MEMORY_REFRESH_NS:
+        try:
+            usage = _read_statm() if _HAS_STATM else _read_psutil()
+        except Exception:
+            return {"rss": 0, "vms": 0}
+        _memory_cache = (now, usage)
+    return dict(usage)
@@ -31,6 +31,9 @@ setup(
         "psutil>=5.9.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.8",
+        ],
         "dev": [
             "pytest>=7.0",
             "pytest-asyncio>=0.21",
@@ -26,6 +26,10 @@ r.set_state('test.value', 42)
 r.set_state('test.name', 'reflexive')
 r.set_state('test.active', True)
 
+assert not r.app_state.set_state('test.value', 42)  # unchanged, nothing to sync
+r.set_state('test.ratio', 0.5)
+assert not r.app_state.set_state('test.ratio', 0.5004, tolerance=0.001)
+
 value = r.get_state('test.value')
 name = r.get_state('test.name')
 all_state = r.get_state()
@@ -41,6 +45,9 @@ print(f"  Retrieved {len(logs)} logs:")
 for log in logs:
     print(f"    [{log['type']}] {log['message']}")
 
+matches = list(r.app_state.search_logs(r"warn(ing)?"))
+print(f"  search_logs found {len(matches)} warning(s)")
+
 # Test 5: Get status
 print("\n✓ Test 5: Getting app status...")
 status = r.app_state.get_status()
@@ -54,6 +61,30 @@ print("\n✓ Test 6: Testing chat (standalone mode)...")
 response = r.chat("What is the current uptime?")
 print(f"  Response: {response}")
 
+# Test 7: Chat response cache
+print("\n✓ Test 7: Testing chat response cache...")
+from reflexive.chat_cache import ChatCache
+cache = ChatCache()
+cache.put("Analyze the pipeline. Is the error rate acceptable?", "Looks healthy")
+assert cache.get("Analyze the pipeline. Is the error rate acceptable?") == "Looks healthy"
+assert cache.get("Analyze the pipeline: is the error rate acceptable") == "Looks healthy"
+assert cache.get("Write a short story about space") is None
+# Near misses must not be served another prompt's answer
+prompt = "Is an error rate of 5% acceptable for the nightly import job?"
+cache.put(prompt, "Yes")
+assert cache.get(prompt.replace("5%", "50%")) is None
+assert cache.get(prompt.replace("acceptable", "not acceptable")) is None
+cache.put("Story topic: a brave knight fights a dragon in the old castle", "Dragon story")
+assert cache.get("Story topic: a brave knight fights a wizard in the old castle") is None
+
+# Fuzzy matching is opt-in, and numbers and negations still have to agree
+fuzzy = ChatCache(threshold=0.95)
+fuzzy.put(prompt, "Yes")
+assert fuzzy.get("Is the error rate of 5% acceptable for this nightly import job") == "Yes"
+assert fuzzy.get(prompt.replace("5%", "50%")) is None
+assert fuzzy.get(prompt.replace("acceptable", "not acceptable")) is None
+print(f"  Cache stats: {cache.stats()}")
+
 print("\n" + "=" * 50)
 print("✅ All tests passed!")
 print("\nTo test with full chat capabilities, run:")
@@ -1067,6 +1067,9 @@ async function startCliDashboard(processManager: ProcessManager, options: CliOpt
           breakpointFile,
           breakpointLine,
           isAutoTrigger,
+          // Static prompt content from SDK clients (e.g. Python make_reflexive options)
+          system,
+          cache_prefixes,
         } = JSON.parse(body);
 
         if (!message) {
@@ -1075,6 +1078,14 @@ async function startCliDashboard(processManager: ProcessManager, options: CliOpt
           return;
         }
 
+        // Static content goes in the system prompt, which the Agent SDK caches across
+        // calls, leaving only app context and the message as the dynamic tail
+        const systemPrompt = [
+          buildSystemPrompt(processManager, options),
+          system,
+          ...(Array.isArray(cache_prefixes) ? cache_prefixes : []),
+        ].filter(Boolean).join('\n\n');
+
         // Store user message in chat history (skip for auto-triggers)
         if (!skipUserStorage) {
           addChatMessage({ role: 'user', content: message, isCliInput });
@@ -1089,7 +1100,7 @@ async function startCliDashboard(processManager: ProcessManager, options: CliOpt
 
         const chatStream = createChatStream(message, {
           contextSummary,
-          systemPrompt: buildSystemPrompt(processManager, options),
+          systemPrompt,
           mcpServer,
           mcpServerName: 'reflexive-cli',
           externalMcpServers,
@@ -1292,6 +1303,27 @@ async function startCliDashboard(processManager: ProcessManager, options: CliOpt
         return;
       }
 
+      // Receive batched state updates (Python SDK coalesces set_state calls)
+      if (pathname === '/client-state-batch' && req.method === 'POST') {
+        try {
+          const { updates } = await parseJsonBody<{ updates: Record<string, unknown> }>(req);
+          if (updates && typeof updates === 'object') {
+            for (const [key, value] of Object.entries(updates)) {
+              processManager.setClientState(key, value);
+            }
+            res.writeHead(200, { 'Content-Type': 'application/json' });
+            res.end(JSON.stringify({ success: true }));
+          } else {
+            res.writeHead(400, { 'Content-Type': 'application/json' });
+            res.end(JSON.stringify({ error: 'updates required' }));
+          }
+        } catch (e) {
+          res.writeHead(400, { 'Content-Type': 'application/json' });
+          res.end(JSON.stringify({ error: (e as Error).message }));
+        }
+        return;
+      }
+
       if (pathname === '/logs') {
         const count = parseInt(url.searchParams.get('count') || '50', 10);
         res.writeHead(200, { 'Content-Type': 'application/json' });